@@ -0,0 +1,209 @@
+import os
+import sqlite3
+import argparse
+from datetime import datetime, timedelta
+from config import DATABASE_NAME, LOW_ATTENDANCE_THRESHOLD
+
+# attendance_daily keeps one row per student per recorded day together with
+# running totals up to and including that day. Counts over any date range are
+# the difference of two prefix rows, so range queries never scan raw attendance.
+
+def init_analytics_db():
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    c.execute('''CREATE TABLE IF NOT EXISTS attendance_daily
+                 (student_id INTEGER NOT NULL,
+                  date TEXT NOT NULL,
+                  present INTEGER NOT NULL,
+                  cum_present INTEGER NOT NULL,
+                  cum_days INTEGER NOT NULL,
+                  absence_streak INTEGER NOT NULL,
+                  longest_absence_streak INTEGER NOT NULL,
+                  PRIMARY KEY (student_id, date),
+                  FOREIGN KEY (student_id) REFERENCES students(id))''')
+    # Backfill databases that already hold attendance from before analytics existed.
+    # This only catches an empty table; run `python analytics.py rebuild` to fix drift.
+    c.execute("""
+        SELECT NOT EXISTS(SELECT 1 FROM attendance_daily)
+           AND EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'attendance')
+    """)
+    if c.fetchone()[0]:
+        c.execute("SELECT EXISTS(SELECT 1 FROM attendance)")
+        if c.fetchone()[0]:
+            _rebuild(c)
+    conn.commit()
+    conn.close()
+
+def _next_row(prev, present):
+    cum_present, cum_days, absence_streak, longest = prev if prev else (0, 0, 0, 0)
+    absence_streak = 0 if present else absence_streak + 1
+    return (present, cum_present + present, cum_days + 1,
+            absence_streak, max(longest, absence_streak))
+
+def _rebuild(c, student_id=None):
+    if student_id is None:
+        c.execute("DELETE FROM attendance_daily")
+        c.execute("""
+            SELECT student_id, date, MAX(status = 'Present')
+            FROM attendance
+            WHERE student_id IN (SELECT id FROM students)
+            GROUP BY student_id, date
+            ORDER BY student_id, date
+        """)
+    else:
+        c.execute("DELETE FROM attendance_daily WHERE student_id = ?", (student_id,))
+        c.execute("""
+            SELECT student_id, date, MAX(status = 'Present')
+            FROM attendance
+            WHERE student_id = ? AND student_id IN (SELECT id FROM students)
+            GROUP BY student_id, date
+            ORDER BY date
+        """, (student_id,))
+    rows = []
+    prev_student, prev = None, None
+    for sid, date, present in c.fetchall():
+        if sid != prev_student:
+            prev_student, prev = sid, None
+        row = _next_row(prev, present)
+        rows.append((sid, date) + row)
+        prev = row[1:]
+    c.executemany("INSERT INTO attendance_daily VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+def update_attendance_analytics(c, date, attendance_data):
+    """Fold one attendance submission into attendance_daily.
+
+    Runs on the caller's cursor so the update commits together with the raw
+    attendance rows. A student counts as present for a day if any submission
+    that day marked them present.
+    """
+    for student_id, status in attendance_data.items():
+        present = 1 if status == "Present" else 0
+        c.execute("SELECT 1 FROM attendance_daily WHERE student_id = ? AND date > ? LIMIT 1",
+                  (student_id, date))
+        if c.fetchone():
+            # Out-of-order day: every later running total shifts, so redo this student
+            _rebuild(c, student_id)
+            continue
+        c.execute("SELECT present FROM attendance_daily WHERE student_id = ? AND date = ?",
+                  (student_id, date))
+        existing = c.fetchone()
+        if existing and existing[0] >= present:
+            continue
+        c.execute("""
+            SELECT cum_present, cum_days, absence_streak, longest_absence_streak
+            FROM attendance_daily
+            WHERE student_id = ? AND date < ?
+            ORDER BY date DESC LIMIT 1
+        """, (student_id, date))
+        row = _next_row(c.fetchone(), present)
+        c.execute("INSERT OR REPLACE INTO attendance_daily VALUES (?, ?, ?, ?, ?, ?, ?)",
+                  (student_id, date) + row)
+
+def rebuild_analytics():
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    _rebuild(c)
+    conn.commit()
+    conn.close()
+
+def get_student_analytics(start_date, end_date, threshold=LOW_ATTENDANCE_THRESHOLD):
+    """Per-student attendance over [start_date, end_date].
+
+    Returns a list of dicts with days recorded and present in the range, the
+    attendance rate, the absence streak running at end_date, the longest
+    absence streak and whether the rate is below threshold. Streaks only count
+    days inside the range. Students with no recorded days in the range are
+    omitted.
+    """
+    start, end = start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    # A row's absence_streak may run back before start_date, so clamp it to the
+    # number of in-range days up to that row before taking the maximum.
+    c.execute("""
+        SELECT s.id, s.name,
+               e.cum_present, e.cum_days, e.absence_streak,
+               b.cum_present, b.cum_days,
+               (SELECT MAX(MIN(d.absence_streak, d.cum_days - IFNULL(b.cum_days, 0)))
+                FROM attendance_daily d
+                WHERE d.student_id = s.id AND d.date BETWEEN ? AND ?)
+        FROM students s
+        JOIN attendance_daily e ON e.student_id = s.id AND e.date = (
+            SELECT MAX(date) FROM attendance_daily WHERE student_id = s.id AND date <= ?)
+        LEFT JOIN attendance_daily b ON b.student_id = s.id AND b.date = (
+            SELECT MAX(date) FROM attendance_daily WHERE student_id = s.id AND date < ?)
+        ORDER BY s.name
+    """, (start, end, end, start))
+    rows = c.fetchall()
+    conn.close()
+
+    analytics = []
+    for (student_id, name, end_present, end_days, streak,
+         before_present, before_days, longest) in rows:
+        days = end_days - (before_days or 0)
+        if days == 0:
+            continue
+        streak = min(streak, days)
+        present = end_present - (before_present or 0)
+        rate = present / days
+        analytics.append({
+            "student_id": student_id,
+            "name": name,
+            "days": days,
+            "present": present,
+            "rate": rate,
+            "absence_streak": streak,
+            "longest_absence_streak": longest,
+            "low_attendance": rate < threshold,
+        })
+    return analytics
+
+def _parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+def main():
+    parser = argparse.ArgumentParser(description="Attendance analytics")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    report = subparsers.add_parser("report", help="Per-student attendance for a date range")
+    report.add_argument("--start", type=_parse_date,
+                        default=datetime.now().date() - timedelta(days=7),
+                        help="Start date (YYYY-MM-DD)")
+    report.add_argument("--end", type=_parse_date, default=datetime.now().date(),
+                        help="End date (YYYY-MM-DD)")
+    report.add_argument("--threshold", type=float, default=LOW_ATTENDANCE_THRESHOLD,
+                        help="Attendance rate below which a student is flagged (0-1)")
+    report.add_argument("--alerts-only", action="store_true",
+                        help="Only list students below the threshold")
+
+    subparsers.add_parser("rebuild", help="Recompute analytics from raw attendance records")
+
+    args = parser.parse_args()
+    if not os.path.exists(DATABASE_NAME):
+        print(f"No database found at {DATABASE_NAME}. Start the app once to create it.")
+        return
+    init_analytics_db()
+
+    if args.command == "rebuild":
+        rebuild_analytics()
+        print("Analytics rebuilt.")
+        return
+
+    if args.start > args.end:
+        parser.error("end date must be after start date")
+
+    analytics = get_student_analytics(args.start, args.end, args.threshold)
+    if args.alerts_only:
+        analytics = [a for a in analytics if a["low_attendance"]]
+    if not analytics:
+        print("No attendance data available for the selected date range.")
+        return
+
+    print(f"{'ID':>5}  {'Name':<25} {'Present':>7} {'Days':>5} {'Rate':>7} {'Streak':>6} {'Longest':>7}")
+    for a in analytics:
+        flag = "  LOW" if a["low_attendance"] else ""
+        print(f"{a['student_id']:>5}  {a['name']:<25} {a['present']:>7} {a['days']:>5} "
+              f"{a['rate']:>7.1%} {a['absence_streak']:>6} {a['longest_absence_streak']:>7}{flag}")
+
+if __name__ == "__main__":
+    main()
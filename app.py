@@ -4,6 +4,8 @@ import numpy as np
 import face_recognition
 from database import init_db, add_student, get_all_students, update_student, delete_student, record_attendance, get_attendance_report
 from face_recognition_utils import process_image
+from analytics import get_student_analytics
+from config import LOW_ATTENDANCE_THRESHOLD
 import logging
 import pandas as pd
 import io
@@ -182,6 +184,32 @@ def attendance_reports_page():
         st.write(f"Present: {present_count}")
         st.write(f"Absent: {absent_count}")
         
+        # Display per-student analytics
+        st.subheader("Student Analytics")
+        threshold = st.slider("Low attendance threshold (%)", 0, 100, int(LOW_ATTENDANCE_THRESHOLD * 100))
+        analytics = get_student_analytics(start_date, end_date, threshold / 100)
+        if analytics:
+            analytics_df = pd.DataFrame(analytics)
+            analytics_df["rate"] = (analytics_df["rate"] * 100).round(1)
+            analytics_df = analytics_df.rename(columns={
+                "student_id": "Student ID",
+                "name": "Name",
+                "days": "Days",
+                "present": "Present",
+                "rate": "Attendance Rate (%)",
+                "absence_streak": "Current Absence Streak",
+                "longest_absence_streak": "Longest Absence Streak",
+                "low_attendance": "Low Attendance",
+            })
+            st.dataframe(analytics_df)
+            
+            for student in analytics:
+                if student["low_attendance"]:
+                    message = f"{student['name']} is below {threshold}% attendance ({student['rate']:.1%}"
+                    if student["absence_streak"] > 0:
+                        message += f", absent {student['absence_streak']} days in a row"
+                    st.warning(message + ")")
+        
         # Display detailed report
         st.subheader("Detailed Report")
         st.dataframe(df)
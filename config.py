@@ -5,3 +5,5 @@ DATABASE_NAME = 'students.db'
 FACE_RECOGNITION_TOLERANCE = 0.6
 FACE_RECOGNITION_MODEL = 'hog'  # Can be 'hog' or 'cnn'
 
+# Analytics configuration
+LOW_ATTENDANCE_THRESHOLD = 0.75  # Attendance rate below which a student is flagged
@@ -2,6 +2,7 @@ import sqlite3
 import pickle
 from datetime import datetime
 from config import DATABASE_NAME
+from analytics import init_analytics_db, update_attendance_analytics
 
 def init_db():
     conn = sqlite3.connect(DATABASE_NAME)
@@ -18,6 +19,7 @@ def init_db():
                   FOREIGN KEY (student_id) REFERENCES students(id))''')
     conn.commit()
     conn.close()
+    init_analytics_db()
 
 def add_student(name, face_encoding):
     conn = sqlite3.connect(DATABASE_NAME)
@@ -50,6 +52,7 @@ def delete_student(id):
     conn = sqlite3.connect(DATABASE_NAME)
     c = conn.cursor()
     c.execute("DELETE FROM students WHERE id = ?", (id,))
+    c.execute("DELETE FROM attendance_daily WHERE student_id = ?", (id,))
     conn.commit()
     conn.close()
 
@@ -60,6 +63,7 @@ def record_attendance(attendance_data):
     for student_id, status in attendance_data.items():
         c.execute("INSERT INTO attendance (student_id, date, status) VALUES (?, ?, ?)",
                   (student_id, date, status))
+    update_attendance_analytics(c, date, attendance_data)
     conn.commit()
     conn.close()
 